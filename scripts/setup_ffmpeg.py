@@ -1,85 +1,211 @@
 import os
+import lzma
 import sys
 import shutil
+import subprocess
 import tarfile
+import tempfile
 import zipfile
 from pathlib import Path
-from urllib.request import urlretrieve
+from urllib.request import urlopen
+
+# zipfile/tarfile extractall copy in 16 KiB chunks; 1 MiB buffers are much
+# faster on these multi-hundred-MB archives
+COPY_BUFFER = 1024 * 1024
 
 ROOT = Path(__file__).resolve().parents[1]
 TOOLS = ROOT / "tools" / "ffmpeg"
 TOOLS.mkdir(parents=True, exist_ok=True)
 
 
-def download(url: str, dest: Path) -> Path:
-	dest.parent.mkdir(parents=True, exist_ok=True)
-	tmp = dest.with_suffix(".download")
-	print(f"Downloading {url} -> {tmp}")
-	urlretrieve(url, tmp.as_posix())
-	tmp.rename(dest)
-	return dest
+def _extract_zip_entries(z: zipfile.ZipFile, dest_dir: Path) -> None:
+	for info in z.infolist():
+		target = dest_dir / info.filename
+		if info.is_dir():
+			target.mkdir(parents=True, exist_ok=True)
+			continue
+		target.parent.mkdir(parents=True, exist_ok=True)
+		with z.open(info) as src, open(target, "wb") as dst:
+			shutil.copyfileobj(src, dst, length=COPY_BUFFER)
+
+
+def _extract_tar_members(t: tarfile.TarFile, dest_dir: Path) -> None:
+	for member in t:
+		target = dest_dir / member.name
+		if member.isdir():
+			target.mkdir(parents=True, exist_ok=True)
+			continue
+		if not member.isfile():
+			t.extract(member, dest_dir)
+			continue
+		target.parent.mkdir(parents=True, exist_ok=True)
+		src = t.extractfile(member)
+		with open(target, "wb") as dst:
+			shutil.copyfileobj(src, dst, length=COPY_BUFFER)
+		target.chmod(member.mode & 0o777)
 
 
 def extract_zip(zip_path: Path, dest_dir: Path) -> None:
 	with zipfile.ZipFile(zip_path, "r") as z:
-		z.extractall(dest_dir)
+		_extract_zip_entries(z, dest_dir)
 
 
 def extract_tar_xz(tar_path: Path, dest_dir: Path) -> None:
-	with tarfile.open(tar_path, "r:xz") as t:
-		t.extractall(dest_dir)
+	# Streaming mode ("r|") reads the xz payload sequentially instead of
+	# seeking around the compressed archive
+	with lzma.LZMAFile(tar_path.as_posix(), "rb") as xz:
+		with tarfile.open(fileobj=xz, mode="r|") as t:
+			_extract_tar_members(t, dest_dir)
+
+
+def stream_tar_xz(url: str, dest_dir: Path) -> None:
+	# Decompress while downloading; the archive itself never touches disk
+	print(f"Streaming {url} -> {dest_dir}")
+	with urlopen(url) as resp:
+		with lzma.LZMAFile(resp) as xz:
+			with tarfile.open(fileobj=xz, mode="r|") as t:
+				_extract_tar_members(t, dest_dir)
+
+
+def stream_zip(url: str, dest_dir: Path) -> None:
+	# Zip central directories sit at the end of the file, so the download has
+	# to be buffered — but in memory (spilling past 64 MB), not a named file
+	print(f"Streaming {url} -> {dest_dir}")
+	with urlopen(url) as resp:
+		with tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024) as buf:
+			shutil.copyfileobj(resp, buf, length=COPY_BUFFER)
+			buf.seek(0)
+			with zipfile.ZipFile(buf) as z:
+				_extract_zip_entries(z, dest_dir)
+
+
+def _find_binary(root: Path, name: str) -> Path | None:
+	"""
+	Locate an extracted ffmpeg binary under root/ffmpeg-*/ with a first-hit
+	scandir walk, instead of glob statting every extracted file.
+	"""
+	try:
+		entries = list(os.scandir(root))
+	except OSError:
+		return None
+	for entry in entries:
+		if not entry.is_dir() or not entry.name.startswith("ffmpeg"):
+			continue
+		base = Path(entry.path)
+		for candidate in (base / name, base / "bin" / name):
+			if candidate.is_file():
+				return candidate
+		# one more level down (e.g. ffmpeg-essentials/<ver>/ffmpeg.exe)
+		try:
+			for sub in os.scandir(entry.path):
+				if sub.is_dir():
+					candidate = Path(sub.path) / name
+					if candidate.is_file():
+						return candidate
+		except OSError:
+			pass
+	return None
+
+
+def _copy_binary(src: Path, dst: Path) -> None:
+	"""
+	Copy the ~100 MB ffmpeg binary with in-kernel copy_file_range/sendfile
+	where available, falling back to a buffered userspace copy.
+	"""
+	with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+		size = os.fstat(fsrc.fileno()).st_size
+		for kernel_copy in ("copy_file_range", "sendfile"):
+			fn = getattr(os, kernel_copy, None)
+			if fn is None:
+				continue
+			try:
+				offset = 0
+				while offset < size:
+					if kernel_copy == "copy_file_range":
+						n = fn(fsrc.fileno(), fdst.fileno(), size - offset)
+					else:
+						n = fn(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+					if n == 0:
+						break
+					offset += n
+				if offset >= size:
+					return
+			except OSError:
+				pass
+			fsrc.seek(0)
+			fdst.seek(0)
+			fdst.truncate()
+		shutil.copyfileobj(fsrc, fdst, length=COPY_BUFFER)
+
+
+def _binary_works(path: Path) -> bool:
+	"""
+	An interrupted extract leaves a truncated binary behind; only treat one
+	as reusable if it actually runs.
+	"""
+	if os.name != "nt":
+		try:
+			path.chmod(0o755)
+		except OSError:
+			return False
+	try:
+		proc = subprocess.run(
+			[str(path), "-version"],
+			stdout=subprocess.DEVNULL,
+			stderr=subprocess.DEVNULL,
+		)
+	except OSError:
+		return False
+	return proc.returncode == 0
 
 
 def ensure_ffmpeg() -> Path:
 	platform = sys.platform
-	target_bin = TOOLS / ("ffmpeg.exe" if platform.startswith("win") else "ffmpeg")
+	bin_name = "ffmpeg.exe" if platform.startswith("win") else "ffmpeg"
+	target_bin = TOOLS / bin_name
 	if target_bin.exists():
 		print(f"ffmpeg already present at {target_bin}")
 		return target_bin
 
+	# A prior run may have left an extracted ffmpeg-*/ build behind even if
+	# the copied binary is gone; reuse it instead of re-downloading, but only
+	# after checking it runs — an interrupted extract leaves truncated files
+	ffbin = _find_binary(TOOLS, bin_name)
+	if ffbin:
+		if _binary_works(ffbin):
+			print(f"Reusing previously extracted build at {ffbin}")
+			_copy_binary(ffbin, target_bin)
+			if not platform.startswith("win"):
+				target_bin.chmod(0o755)
+			return target_bin
+		print(f"Ignoring unusable build at {ffbin}; re-downloading")
+
 	if platform.startswith("win"):
 		# Stable essentials zip from gyan.dev (contains bin/ffmpeg.exe)
 		url = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip"
-		archive = TOOLS / "ffmpeg.zip"
-		download(url, archive)
-		extract_zip(archive, TOOLS)
-		# find ffmpeg.exe under extracted dir
-		ffbin = None
-		for p in TOOLS.glob("ffmpeg-*/*/ffmpeg.exe"):
-			ffbin = p
-			break
+		stream_zip(url, TOOLS)
+		# find ffmpeg.exe under extracted dir (covers ffmpeg-*/bin/ and nested layouts)
+		ffbin = _find_binary(TOOLS, "ffmpeg.exe")
 		if not ffbin:
-			# alternate layout: ffmpeg-*/bin/ffmpeg.exe
-			for p in TOOLS.glob("ffmpeg-*/bin/ffmpeg.exe"):
-				ffbin = p
-				break
-		if not ffbin or not ffbin.exists():
 			raise RuntimeError("Could not locate ffmpeg.exe in the downloaded archive")
-		shutil.copy2(ffbin, target_bin)
+		_copy_binary(ffbin, target_bin)
 		return target_bin
 
 	if platform.startswith("linux"):
 		# Static Linux build (amd64)
 		url = "https://johnvansickle.com/ffmpeg/releases/ffmpeg-release-amd64-static.tar.xz"
-		archive = TOOLS / "ffmpeg.tar.xz"
-		download(url, archive)
-		extract_tar_xz(archive, TOOLS)
-		ffbin = None
-		for p in TOOLS.glob("ffmpeg-*static/ffmpeg"):
-			ffbin = p
-			break
-		if not ffbin or not ffbin.exists():
+		stream_tar_xz(url, TOOLS)
+		ffbin = _find_binary(TOOLS, "ffmpeg")
+		if not ffbin:
 			raise RuntimeError("Could not locate ffmpeg in the downloaded archive")
-		shutil.copy2(ffbin, target_bin)
+		_copy_binary(ffbin, target_bin)
 		target_bin.chmod(0o755)
 		return target_bin
 
 	if platform == "darwin":
 		# macOS universal zip (community build)
 		url = "https://evermeet.cx/ffmpeg/ffmpeg-6.1.1.zip"
-		archive = TOOLS / "ffmpeg-mac.zip"
-		download(url, archive)
-		extract_zip(archive, TOOLS)
+		stream_zip(url, TOOLS)
 		ffbin = TOOLS / "ffmpeg"
 		if not ffbin.exists():
 			# sometimes zip contains nested name
@@ -89,7 +215,7 @@ def ensure_ffmpeg() -> Path:
 					break
 		if not ffbin.exists():
 			raise RuntimeError("Could not locate ffmpeg in the downloaded archive")
-		shutil.copy2(ffbin, target_bin)
+		_copy_binary(ffbin, target_bin)
 		target_bin.chmod(0o755)
 		return target_bin
 
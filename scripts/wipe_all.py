@@ -1,7 +1,9 @@
 import os
 import sys
+import sqlite3
 import argparse
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 # Import helpers from app.py
 try:
@@ -33,22 +35,32 @@ def wipe_b2_bucket_contents() -> tuple[int, int]:
 	if not bucket:
 		raise RuntimeError("B2_BUCKET is not set")
 	s3 = get_s3_client()
-	# Prefix "" to cover entire bucket
-	deleted, errors = s3_delete_all_versions_with_prefix(s3, bucket, "")
+	# Prefix "" to cover entire bucket; a full wipe is pure round-trip latency,
+	# so run more delete batches in flight than the admin delete path does
+	deleted, errors = s3_delete_all_versions_with_prefix(s3, bucket, "", max_workers=16)
 	return deleted, errors
 
 
 def wipe_database() -> None:
 	"""
-	Remove the SQLite database file completely and re-initialize a fresh schema.
-	This resets autoincrement so events start again from ID 1.
+	Drop every user table in place, VACUUM, and re-initialize a fresh schema.
+	Dropping resets autoincrement so events start again from ID 1, without a
+	window where the database file is absent.
 	"""
 	db_path = DATABASE_PATH
+	conn = sqlite3.connect(db_path)
 	try:
-		if os.path.exists(db_path):
-			os.remove(db_path)
-	except FileNotFoundError:
-		pass
+		names = [r[0] for r in conn.execute(
+			"SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
+		).fetchall()]
+		for name in names:
+			conn.execute(f'DROP TABLE IF EXISTS "{name}"')
+		# Reset the schema-version gate so re-initialization actually runs
+		conn.execute("PRAGMA user_version = 0")
+		conn.commit()
+		conn.execute("VACUUM")
+	finally:
+		conn.close()
 	# Recreate the schema fresh
 	ensure_database_initialized(db_path)
 
@@ -65,26 +77,27 @@ def main() -> int:
 		print("Refusing to proceed without --yes. This operation is destructive.")
 		return 2
 
-	# Wipe B2 bucket contents (all versions)
+	# The bucket and the local database are independent resources: overlap
+	# the minutes of B2 round-trips with the millisecond-scale SQLite reset
 	print("Deleting ALL objects and versions from B2 bucket...")
-	deleted, errors = (0, 0)
-	try:
-		deleted, errors = wipe_b2_bucket_contents()
-		print(f"B2: deleted={deleted}, errors={errors}")
-	except Exception as e:
-		print("ERROR wiping B2 bucket:", e, file=sys.stderr)
-		traceback.print_exc()
-		# Continue to wipe DB even if storage failed
-
-	# Wipe local database file and re-init schema
-	print("Deleting local SQLite database and reinitializing...")
-	try:
-		wipe_database()
-		print("Database reset complete.")
-	except Exception as e:
-		print("ERROR wiping database:", e, file=sys.stderr)
-		traceback.print_exc()
-		return 1
+	print("Dropping local SQLite tables and reinitializing...")
+	with ThreadPoolExecutor(max_workers=2) as ex:
+		b2_future = ex.submit(wipe_b2_bucket_contents)
+		db_future = ex.submit(wipe_database)
+		try:
+			deleted, errors = b2_future.result()
+			print(f"B2: deleted={deleted}, errors={errors}")
+		except Exception as e:
+			print("ERROR wiping B2 bucket:", e, file=sys.stderr)
+			traceback.print_exc()
+			# The DB wipe still runs (and is awaited) even if storage failed
+		try:
+			db_future.result()
+			print("Database reset complete.")
+		except Exception as e:
+			print("ERROR wiping database:", e, file=sys.stderr)
+			traceback.print_exc()
+			return 1
 
 	print("All done.")
 	return 0